@@ -0,0 +1,18 @@
+"""
+Test package
+
+Importing the service package creates the tables in the shared database.
+Under pytest-xdist every worker does that at about the same time, so the
+import is serialized with a file lock to keep concurrent CREATE TYPE /
+CREATE TABLE statements from colliding and making a worker exit.
+"""
+import os
+
+if os.getenv("PYTEST_XDIST_WORKER"):
+    # pylint: disable=import-outside-toplevel
+    import fcntl
+    import tempfile
+
+    with open(os.path.join(tempfile.gettempdir(), "product-tests.lock"), "w", encoding="utf-8") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)  # released when the file is closed
+        import service  # noqa: F401
@@ -0,0 +1,55 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test database helpers for running the test suite in parallel
+
+With pytest-xdist (pytest -n auto) every worker gets its own PostgreSQL
+database so tests in different workers never see each other's rows.
+The <database>_gw<N> databases are not dropped after the run; the next
+run reuses them. Drop them by hand to reclaim the space.
+"""
+import os
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+
+
+def worker_database_uri(database_uri: str) -> str:
+    """Returns a database URI private to the current pytest-xdist worker
+
+    :param database_uri: the URI of the shared test database
+    :type database_uri: str
+
+    :return: the worker's URI, or database_uri unchanged when not running
+             under pytest-xdist or not using PostgreSQL
+    :rtype: str
+
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    url = make_url(database_uri)
+    if not worker or url.get_backend_name() != "postgresql":
+        return database_uri
+
+    worker_url = url.set(database=f"{url.database}_{worker}")
+    # CREATE DATABASE cannot run inside a transaction block
+    engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    with engine.connect() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"),
+            {"name": worker_url.database},
+        ).scalar()
+        if not exists:
+            conn.execute(text(f'CREATE DATABASE "{worker_url.database}"'))
+    engine.dispose()
+    return worker_url.render_as_string(hide_password=False)